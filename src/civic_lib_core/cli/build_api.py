@@ -17,6 +17,14 @@ from civic_lib_core import log_utils, project_layout
 
 logger = log_utils.logger
 
+# Characters allowed in package names besides letters and digits, removed in one pass
+_NAME_SEPARATORS = str.maketrans("", "", "_.")
+
+
+def _is_safe_name(name: str) -> bool:
+    """Return True if name is only letters, digits, underscores, and dots."""
+    return name.translate(_NAME_SEPARATORS).isalnum()
+
 
 def main() -> int:
     """Generate standalone HTML API documentation using pdoc.
@@ -66,7 +74,7 @@ def _validate_packages(packages):
         int: error code if validation fails, 0 if successful
     """
     for package in packages:
-        if not package.replace("_", "").replace(".", "").isalnum():
+        if not _is_safe_name(package):
             logger.error(f"Invalid package name detected: {package}")
             return 1
     return 0
@@ -109,7 +117,7 @@ def _validate_command(cmd, output_dir):
                 logger.error(f"Output directory mismatch: expected {output_dir}, got {arg}")
                 return 1
         else:  # Package names
-            if not arg.replace("_", "").replace(".", "").isalnum():
+            if not _is_safe_name(arg):
                 logger.error(f"Unsafe package name detected: {arg}")
                 return 1
     return 0
@@ -257,7 +265,7 @@ def _validate_output_directory(arg, output_dir):
 
 def _validate_package_name(arg):
     """Validate a package name argument."""
-    if not arg.replace("_", "").replace(".", "").isalnum():
+    if not _is_safe_name(arg):
         logger.error(f"Unsafe package name: {arg}")
         return 1
     return 0
@@ -328,7 +336,7 @@ def _validate_trusted_command_final(trusted_cmd, output_dir):
     for arg in trusted_cmd[3:]:
         if arg in ["--output-dir", str(output_dir)]:
             continue
-        if not arg.replace("_", "").replace(".", "").isalnum():
+        if not _is_safe_name(arg):
             logger.error(f"Unsafe argument in trusted command: {arg}")
             return False
 
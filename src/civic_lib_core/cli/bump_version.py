@@ -2,7 +2,7 @@
 
 This tool replaces the old version with the new version in:
 - VERSION
-- pyproject.toml
+- pyproject.toml (the [project] version only)
 - README.md
 
 Usage:
@@ -15,12 +15,41 @@ Module: cli.bump_version
 """
 
 from pathlib import Path
+import re
 import sys
 
 from civic_lib_core import log_utils
 
 logger = log_utils.logger
 
+_PROJECT_TABLE_RE = re.compile(rb"^\[project\][ \t]*(?:#.*)?\r?$", re.MULTILINE)
+_NEXT_TABLE_RE = re.compile(rb"^\[", re.MULTILINE)
+
+
+def _replace_project_version(raw: bytes, old: bytes, new: bytes) -> bytes:
+    """Replace the version value in the [project] table of pyproject.toml content.
+
+    Dependency pins, URLs, and other tables that happen to contain the old
+    version are left untouched.
+
+    Returns:
+        bytes: Updated content, or the original content if no match was found.
+    """
+    table = _PROJECT_TABLE_RE.search(raw)
+    if not table:
+        return raw
+    next_table = _NEXT_TABLE_RE.search(raw, table.end())
+    end = next_table.start() if next_table else len(raw)
+
+    version_re = re.compile(
+        rb"^([ \t]*version[ \t]*=[ \t]*)([\"'])" + re.escape(old) + rb"\2", re.MULTILINE
+    )
+    match = version_re.search(raw, table.end(), end)
+    if not match:
+        return raw
+    quote = match.group(2)
+    return raw[: match.start()] + match.group(1) + quote + new + quote + raw[match.end() :]
+
 
 def update_file(path: Path, old: str, new: str) -> bool:
     """Replace version string in the specified file if found.
@@ -28,17 +57,29 @@ def update_file(path: Path, old: str, new: str) -> bool:
     Returns:
         bool: True if file was modified, False otherwise.
     """
-    if not path.exists():
+    # Open directly; a missing file costs one failed open rather than a stat first
+    try:
+        with path.open("rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         logger.info(f"Skipping: {path} (not found)")
         return False
 
-    content = path.read_text(encoding="utf-8")
-    updated = content.replace(old, new)
-
-    if content != updated:
-        path.write_text(updated, encoding="utf-8")
-        logger.info(f"Updated: {path}")
-        return True
+    old_bytes = old.encode("utf-8")
+
+    # Most files checked don't mention the old version; skip decoding them entirely.
+    # UTF-8 is self-synchronizing, so a byte-level replace matches str.replace.
+    if old_bytes in raw and old != new:
+        new_bytes = new.encode("utf-8")
+        if path.name == "pyproject.toml":
+            updated = _replace_project_version(raw, old_bytes, new_bytes)
+        else:
+            updated = raw.replace(old_bytes, new_bytes)
+        if updated != raw:
+            with path.open("wb") as f:
+                f.write(updated)
+            logger.info(f"Updated: {path}")
+            return True
     logger.info(f"No changes needed in: {path}")
     return False
 
@@ -96,9 +96,13 @@ def _validate_git_executable() -> str:
     return git_path
 
 
+# Characters stripped from a tag before checking the rest is alphanumeric
+_TAG_SEPARATORS = str.maketrans("", "", ".-_v")
+
+
 def _validate_tag(tag: str) -> None:
     """Validate tag format for security."""
-    if not tag.replace(".", "").replace("-", "").replace("_", "").replace("v", "").isalnum():
+    if not tag.translate(_TAG_SEPARATORS).isalnum():
         raise RuntimeError(f"Invalid tag format: {tag}")
     if not all(c.isalnum() or c in ".-_v" for c in tag):
         raise RuntimeError(f"Tag contains unsafe characters: {tag}")
@@ -18,6 +18,7 @@ Typical usage:
     major, minor, patch = config_utils.parse_version("1.2.3")
 """
 
+import functools
 import os
 from pathlib import Path
 import re
@@ -37,6 +38,9 @@ __all__ = [
 
 logger = log_utils.logger
 
+# MAJOR.MINOR.PATCH, optionally followed by a pre-release/build suffix (rc1, -beta.2, +local)
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:[-+.]?[0-9A-Za-z][0-9A-Za-z.+-]*)?$")
+
 
 def load_api_key(env_var: str, service_name: str) -> str:
     """Load an API key from the environment variables.
@@ -114,9 +118,16 @@ def load_version(filename: str = "VERSION", root_dir: Path | None = None) -> str
         sys.exit(f"Error: VERSION file missing or unreadable at {version_path}.")
 
 
+@functools.lru_cache(maxsize=256)
 def parse_version(version: str) -> tuple[int, int, int]:
     """Parse a version string (e.g. "1.2.3") into a tuple of integers.
 
+    Pre-release and build suffixes such as "1.2.3rc1", "1.2.3-beta.1", or
+    "1.2.3+local" are accepted and ignored.
+
+    Results are cached, so repeated calls with the same string return the same
+    tuple. Invalid input is not cached and raises on every call.
+
     Args:
         version (str): Version string.
 
@@ -126,7 +137,14 @@ def parse_version(version: str) -> tuple[int, int, int]:
     Raises:
         ValueError: If the version format is invalid.
     """
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version)
+    # Fast path for plain MAJOR.MINOR.PATCH; isdecimal() matches what \d accepts
+    parts = version.split(".")
+    if len(parts) == 3:
+        major, minor, patch = parts
+        if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+            return int(major), int(minor), int(patch)
+
+    match = _VERSION_RE.match(version)
     if not match:
         raise ValueError(f"Invalid version format: {version}")
     major, minor, patch = match.groups()
@@ -5,13 +5,21 @@ Unified utilities used across Civic Interconnect agents and libraries.
 
 """
 
+from collections.abc import Mapping
+import copy
+import functools
+import os
 from pathlib import Path
+import re
+from typing import Any
+
+from loguru import logger
 
-from civic_lib_core import log_utils
 from civic_lib_core.project_layout import ProjectLayout
 from civic_lib_core.project_policy import load_project_policy
 
 __all__ = [
+    "clear_layout_cache",
     "discover_project_layout",
     "ensure_dir",
     "get_data_config_dir",
@@ -23,11 +31,42 @@ __all__ = [
     "get_runtime_config_path",
     "get_source_dir",
     "get_valid_packages",
+    "is_pruned_dir",
     "resolve_path",
     "safe_filename",
 ]
 
-logger = log_utils.logger
+
+# Non-ASCII fallback for safe_filename; \w matches exactly str.isalnum() plus "_"
+_FILENAME_SEPARATORS = re.compile(r"[ /\\:]")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.\-]")
+
+# Build output and environment directories, pruned only directly under the directory
+# being walked: deeper down, a real subpackage may have one of these names
+_TOP_LEVEL_PRUNED_DIRS = frozenset({"build", "dist", "node_modules", "site-packages", "venv"})
+
+# Entries that mark a directory as the project root
+_ROOT_MARKERS = frozenset({".git", "pyproject.toml"})
+
+# ASCII translation table for safe_filename: keep alphanumerics (lowercased) and "._-",
+# turn spaces and path separators into "_", and drop everything else.
+_SAFE_FILENAME_TABLE: dict[int, str | None] = {
+    code: (
+        chr(code).lower()
+        if chr(code).isalnum() or chr(code) in "._-"
+        else "_"
+        if chr(code) in " /\\:"
+        else None
+    )
+    for code in range(128)
+}
+
+# Package names found per source directory; layout does not change within a run
+_pkg_cache: dict[str, list[str]] = {}
+
+# Source dir chosen per (project root, configured src_dirs), stored relative to the root.
+# Misses are not cached, so a source dir created later in the run is still found.
+_source_dir_cache: dict[tuple[str, tuple[str, ...]], str] = {}
 
 
 def discover_project_layout() -> ProjectLayout:
@@ -51,12 +90,20 @@ def discover_project_layout() -> ProjectLayout:
     Note:
         This function performs automatic discovery and may return empty collections
         or None values for components that are not found or configured in the project.
+        Results are cached per project root; call clear_layout_cache() after
+        changing the project structure in-process. Each call returns its own
+        packages list and policy dictionary, so callers may modify them freely.
     """
-    root = get_project_root()
+    layout = _discover_layout(get_project_root())
+    return layout._replace(packages=list(layout.packages), policy=copy.deepcopy(layout.policy))
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_layout(root: Path) -> ProjectLayout:
     policy = load_project_policy(root)
-    docs_dir = get_docs_dir(root)
-    docs_api_dir = get_docs_api_dir(root)
-    src = get_source_dir(root)
+    docs_dir = get_docs_dir(root, policy)
+    docs_api_dir = get_docs_api_dir(root, policy=policy, docs_dir=docs_dir)
+    src = get_source_dir(root, policy)
     packages = get_valid_packages(src) if src else []
     org_name = get_org_name(root)
 
@@ -70,22 +117,60 @@ def discover_project_layout() -> ProjectLayout:
         policy=policy,
     )
 
-    logger.debug(f"Discovered project layout: {layout}")
+    logger.opt(lazy=True).debug("Discovered project layout: {}", lambda: repr(layout))
     return layout
 
 
-def _is_python_package(path: Path) -> bool:
-    if not path.is_dir():
-        return False
+def clear_layout_cache() -> None:
+    """Clear cached project root, policy, source directory, and package lookups.
+
+    Call this after creating, moving, or removing project markers or packages
+    in-process, so later lookups see the new layout.
+    """
+    _find_project_root.cache_clear()
+    _discover_layout.cache_clear()
+    _pkg_cache.clear()
+    _source_dir_cache.clear()
 
-    if (path / "__init__.py").exists():
-        return True
 
-    py_files = list(path.glob("*.py"))
-    if py_files:
-        logger.debug(f"Found namespace package: {path.name}")
+def _package_names(src_dir: Path) -> list[str] | None:
+    """Return the package names directly under src_dir, or None if it is not a directory.
+
+    A directory holding packages is scanned once per run; later calls are served
+    from _pkg_cache.
+    """
+    # String cache key; no filesystem access needed
+    key = os.path.abspath(src_dir)  # noqa: PTH100
+    names = _pkg_cache.get(key)
+    if names is None:
+        try:
+            with os.scandir(src_dir) as entries:
+                names = [entry.name for entry in entries if _is_python_package(entry)]
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if names:
+            # Empty results are not cached; packages may still be created in this run
+            _pkg_cache[key] = names
+    return names
+
+
+def _is_python_package(entry: os.DirEntry[str]) -> bool:
+    return entry.is_dir() and _has_python_sources(entry.path)
+
+
+def _has_python_sources(path: str) -> bool:
+    # path is a DirEntry string; avoid building a Path for every candidate directory.
+    # Not cached: hits end up in _pkg_cache, and a miss may be populated later.
+    if os.path.isfile(os.path.join(path, "__init__.py")):  # noqa: PTH113, PTH118
         return True
 
+    # Namespace package: stop at the first .py file rather than listing them all
+    with os.scandir(path) as children:
+        for child in children:
+            if child.name.endswith(".py") and child.is_file():
+                logger.debug("Found namespace package: {}", Path(path).name)
+                return True
+
     return False
 
 
@@ -96,7 +181,7 @@ def ensure_dir(path: str | Path) -> Path:
         path (str | Path): The directory path to ensure exists. Can be a string or Path object.
 
     Returns:
-        Path: The resolved Path object of the created/existing directory.
+        Path: The absolute Path object of the created/existing directory.
 
     Raises:
         OSError: If the directory cannot be created due to permissions or other filesystem issues.
@@ -109,9 +194,10 @@ def ensure_dir(path: str | Path) -> Path:
         PosixPath('/absolute/path/to/relative/path')
     """
     try:
-        path = Path(path).resolve()
+        # String-only normalization; Path.resolve() would lstat every component
+        path = Path(os.path.abspath(path))  # noqa: PTH100
         path.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured directory exists: {path}")
+        logger.debug("Ensured directory exists: {}", path)
         return path
     except OSError as e:
         logger.error(f"Failed to create directory {path}: {e}")
@@ -132,45 +218,58 @@ def get_data_config_dir(project_root: Path | None = None) -> Path:
     return root / "data-config"
 
 
-def get_docs_dir(root_dir: Path | None = None) -> Path:
+def get_docs_dir(root_dir: Path | None = None, policy: Mapping[str, Any] | None = None) -> Path:
     """Determine the project's main docs directory.
 
     Tries:
     1. Client repo policy (docs.site_dir or docs.docs_dir)
     2. Defaults to 'docs'
+
+    An already-loaded policy may be passed to avoid loading it again.
     """
     root_dir = root_dir or get_project_root()
-    policy = load_project_policy(root_dir)
+    if policy is None:
+        policy = load_project_policy(root_dir)
 
     docs_dir_name = (
         policy.get("docs", {}).get("site_dir") or policy.get("docs", {}).get("docs_dir") or "docs"
     )
     docs_dir = root_dir / docs_dir_name
 
-    if docs_dir.exists() and docs_dir.is_dir():
-        logger.debug(f"Docs dir found: {docs_dir}")
+    if docs_dir.is_dir():
+        logger.debug("Docs dir found: {}", docs_dir)
         return docs_dir
 
     fallback = root_dir / "docs"
-    logger.debug(f"Defaulting docs dir to: {fallback}")
+    logger.debug("Defaulting docs dir to: {}", fallback)
     return fallback
 
 
-def get_docs_api_dir(root_dir: Path | None = None, create: bool = False) -> Path:
+def get_docs_api_dir(
+    root_dir: Path | None = None,
+    create: bool = False,
+    policy: Mapping[str, Any] | None = None,
+    docs_dir: Path | None = None,
+) -> Path:
     """Determine the project's API docs subdirectory.
 
     Tries:
     1. Client repo policy (docs.api_markdown_subdir)
     2. Defaults to 'docs/api'
+
+    An already-loaded policy and an already-resolved docs directory may be passed
+    to avoid computing them again.
     """
     root_dir = root_dir or get_project_root()
-    docs_dir = get_docs_dir(root_dir)
-    policy = load_project_policy(root_dir)
+    if policy is None:
+        policy = load_project_policy(root_dir)
+    if docs_dir is None:
+        docs_dir = get_docs_dir(root_dir, policy)
 
     api_subdir = policy.get("docs", {}).get("api_markdown_subdir", "api")
     candidate = docs_dir / api_subdir
 
-    logger.debug(f"API docs dir resolved to: {candidate}")
+    logger.debug("API docs dir resolved to: {}", candidate)
     return ensure_dir(candidate) if create else candidate
 
 
@@ -194,22 +293,59 @@ def get_project_root(start_path: Path | None = None) -> Path:
             If None, uses the current working directory. Defaults to None.
 
     Returns:
-        Path: The resolved path to the project root directory.
+        Path: The absolute path to the project root directory.
 
     Raises:
         RuntimeError: If no project root is found by searching upward from the start path.
     """
-    current = start_path or Path.cwd()
-    markers = [".git", "pyproject.toml"]
-
-    for parent in [current] + list(current.parents):
-        for marker in markers:
-            if (parent / marker).exists():
-                logger.debug(f"Project root found at: {parent.resolve()} (marker: {marker})")
-                return parent.resolve()
+    # Plain string key for the cached walker below
+    return _find_project_root(os.path.abspath(start_path or os.getcwd()))  # noqa: PTH100, PTH109
+
+
+@functools.lru_cache(maxsize=8)
+def _find_project_root(start: str) -> Path:
+    # Walk up with plain strings; a Path is only built for the result
+    current = start
+    while True:
+        # One directory read per level, stopping at the first marker entry
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name in _ROOT_MARKERS:
+                        logger.debug("Project root found at: {} (marker: {})", current, entry.name)
+                        return Path(current)
+        except OSError:
+            pass
+
+        parent = os.path.dirname(current)  # noqa: PTH120
+        if parent == current:
+            break
+        current = parent
 
     raise RuntimeError(
-        f"Project root not found. Searched from '{current.resolve()}' upward for markers: {markers}."
+        f"Project root not found. Searched from '{start}' upward "
+        f"for markers: {sorted(_ROOT_MARKERS)}."
+    )
+
+
+def is_pruned_dir(name: str, top_level: bool) -> bool:
+    """Return True for directories a source walk should not descend into.
+
+    Caches, hidden directories, and egg-info are pruned at any depth; build output
+    and environment directories only when top_level is True.
+
+    Args:
+        name (str): The directory name (not a path).
+        top_level (bool): Whether the directory sits directly under the walk's root.
+
+    Returns:
+        bool: True if the walk should skip the directory.
+    """
+    return (
+        name == "__pycache__"
+        or name.startswith(".")
+        or name.endswith(".egg-info")
+        or (top_level and name in _TOP_LEVEL_PRUNED_DIRS)
     )
 
 
@@ -227,13 +363,15 @@ def get_repo_package_names(root_path: Path | None = None) -> list[str]:
             return []
 
         packages: list[str] = []
+        top = os.fspath(src_dir)
 
-        for init_file in src_dir.rglob("__init__.py"):
-            # Compute relative path from src/ to the package folder
-            pkg_path = init_file.parent.relative_to(src_dir)
-            if pkg_path.parts:
-                package_name = ".".join(pkg_path.parts)
-                packages.append(package_name)
+        for dirpath, dirnames, filenames in os.walk(top):
+            # Prune in place so caches, build output, and hidden dirs are never read
+            top_level = dirpath == top
+            dirnames[:] = [d for d in dirnames if not is_pruned_dir(d, top_level)]
+            if not top_level and "__init__.py" in filenames:
+                # Compute relative path from src/ to the package folder
+                packages.append(os.path.relpath(dirpath, top).replace(os.sep, "."))
 
         if not packages:
             logger.warning("No packages discovered under src.")
@@ -259,36 +397,42 @@ def get_runtime_config_path(project_root: Path | None = None) -> Path:
     return root / "runtime_config.yaml"
 
 
-def get_source_dir(root_dir: Path) -> Path | None:
+def get_source_dir(root_dir: Path, policy: Mapping[str, Any] | None = None) -> Path | None:
     """Get the source directory containing Python packages for the project.
 
     Args:
         root_dir (Path): The root directory path of the project.
+        policy (Mapping[str, Any] | None, optional): An already-loaded project policy.
+            If None, the policy is loaded for root_dir. Defaults to None.
 
     Returns:
         Path | None: The path to the source directory if found and contains valid
             Python packages, otherwise None.
     """
-    policy = load_project_policy(root_dir)
+    if policy is None:
+        policy = load_project_policy(root_dir)
     src_dirs_config = policy.get("build", {}).get("src_dirs", ["src"])
 
-    candidates = []
     if isinstance(src_dirs_config, str):
-        candidates.append(root_dir / src_dirs_config)
+        src_dirs = (src_dirs_config,)
     elif isinstance(src_dirs_config, list):
-        candidates.extend([root_dir / s for s in src_dirs_config])
-
-    if not candidates and (root_dir / "src").is_dir():
-        candidates.append(root_dir / "src")
-
-    for candidate in candidates:
-        if candidate.exists() and candidate.is_dir():
-            packages = [p for p in candidate.iterdir() if p.is_dir() and _is_python_package(p)]
-            if packages:
-                logger.debug(
-                    f"Source directory: {candidate} with packages: {[p.name for p in packages]}"
-                )
-                return candidate
+        src_dirs = tuple(src_dirs_config)
+    else:
+        src_dirs = ()
+    src_dirs = src_dirs or ("src",)
+
+    key = (os.path.abspath(root_dir), src_dirs)  # noqa: PTH100
+    cached = _source_dir_cache.get(key)
+    if cached is not None:
+        return root_dir / cached
+
+    for src_dir in src_dirs:
+        candidate = root_dir / src_dir
+        packages = _package_names(candidate)
+        if packages:
+            logger.debug("Source directory: {} with packages: {}", candidate, packages)
+            _source_dir_cache[key] = src_dir
+            return candidate
 
     logger.warning(
         f"No valid source directory with Python packages found in {root_dir} "
@@ -308,16 +452,17 @@ def get_valid_packages(src_dir: Path) -> list[Path]:
             Returns an empty list if no packages are found or if the source
             directory doesn't exist.
     """
-    if not src_dir.exists() or not src_dir.is_dir():
+    names = _package_names(src_dir)
+    if names is None:
         logger.warning(f"Source directory does not exist or is not a directory: {src_dir}")
         return []
 
-    packages = [p for p in src_dir.iterdir() if _is_python_package(p)]
+    packages = [src_dir / name for name in names]
     if not packages:
-        logger.debug(f"No valid Python packages found in: {src_dir}")
+        logger.debug("No valid Python packages found in: {}", src_dir)
         return []
 
-    logger.debug(f"Found packages: {[p.name for p in packages]}")
+    logger.debug("Found packages: {}", names)
     return packages
 
 
@@ -328,15 +473,15 @@ def resolve_path(relative_path: str | Path) -> Path:
         relative_path (str | Path): The relative path to resolve. Can be a string or Path object.
 
     Returns:
-        Path: The resolved absolute path relative to the project root.
+        Path: The absolute path relative to the project root.
 
     Example:
         >>> resolve_path("src/package")
         PosixPath('/absolute/path/to/project/src/package')
     """
     root = get_project_root()
-    resolved = (root / Path(relative_path)).resolve()
-    logger.debug(f"Resolved '{relative_path}' to: {resolved}")
+    resolved = Path(os.path.abspath(root / relative_path))  # noqa: PTH100
+    logger.debug("Resolved '{}' to: {}", relative_path, resolved)
     return resolved
 
 
@@ -362,14 +507,14 @@ def safe_filename(name: str, max_length: int = 255) -> str:
     if not name:
         return "unnamed"
 
-    safe_chars = []
-    for char in name:
-        if char.isalnum() or char in "._-":
-            safe_chars.append(char.lower())
-        elif char in " /\\:":
-            safe_chars.append("_")
+    if name.isascii():
+        result = name.translate(_SAFE_FILENAME_TABLE)
+    else:
+        # str.translate falls off its fast path on non-ASCII input; the regex engine does not.
+        # Characters are lowercased one at a time to match str.lower() per character.
+        result = _UNSAFE_FILENAME_CHARS.sub("", _FILENAME_SEPARATORS.sub("_", name))
+        result = "".join(map(str.lower, result))
 
-    result = "".join(safe_chars)
     if not result:
         result = "file"
     if result.startswith("."):
@@ -378,5 +523,5 @@ def safe_filename(name: str, max_length: int = 255) -> str:
         result = result[:max_length].rstrip("_")
     result = result.rstrip("_") or "unnamed"
 
-    logger.debug(f"Sanitized filename '{name}' to: '{result}'")
+    logger.debug("Sanitized filename '{}' to: '{}'", name, result)
     return result
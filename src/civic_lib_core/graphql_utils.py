@@ -10,27 +10,149 @@ Provides:
 """
 
 import asyncio
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
+import functools
+import operator
 from typing import Any
 
 from gql import Client
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
 from gql.transport.exceptions import (
+    TransportError,
     TransportProtocolError,
     TransportQueryError,
     TransportServerError,
 )
-
-from civic_lib_core import log_utils
+from loguru import logger
 
 __all__ = [
     "async_paged_query",
+    "close_clients",
     "paged_query",
     "fetch_paginated",
     "handle_transport_errors",
 ]
 
-logger = log_utils.logger
+
+_get_node = operator.itemgetter("node")
+
+# Errors after which a pooled connection may be unusable. TransportQueryError is a
+# GraphQL error response on a healthy connection, so it does not count.
+_CONNECTION_ERRORS = (TransportError, OSError, TimeoutError)
+
+
+class _SessionPool:
+    """Connected sessions for one event loop, keyed by (url, api_key).
+
+    Repeated queries against the same endpoint reuse one aiohttp connection pool
+    (and its TLS sessions and DNS cache). A session is only closed once no query
+    is using it.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.sessions: dict[tuple[str, str], AsyncClientSession] = {}
+        self.users: dict[int, int] = {}
+        self.shutdown_hook: AsyncGenerator[None] | None = None
+
+    async def acquire(self, url: str, api_key: str) -> AsyncClientSession:
+        """Return a connected session for the endpoint, opening it on first use."""
+        async with self.lock:
+            session = self.sessions.get((url, api_key))
+            if session is None:
+                headers = {"Authorization": f"Bearer {api_key}"}
+                transport = AIOHTTPTransport(url=url, headers=headers, ssl=True)
+                client = Client(transport=transport, fetch_schema_from_transport=False)
+                session = await client.connect_async()
+                self.sessions[(url, api_key)] = session
+            self.users[id(session)] = self.users.get(id(session), 0) + 1
+            return session
+
+    def evict(self, url: str, api_key: str, session: AsyncClientSession) -> None:
+        """Stop handing out session; it is closed when its last user releases it."""
+        if self.sessions.get((url, api_key)) is session:
+            del self.sessions[(url, api_key)]
+
+    async def release(self, session: AsyncClientSession) -> None:
+        """Drop one use of session, closing it if it was evicted and is now idle."""
+        remaining = self.users.pop(id(session)) - 1
+        if remaining:
+            self.users[id(session)] = remaining
+        elif session not in self.sessions.values():
+            await session.client.close_async()
+
+    async def close(self) -> None:
+        """Close idle sessions now and the rest as soon as their queries finish."""
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        for session in sessions:
+            if id(session) not in self.users:
+                await session.client.close_async()
+
+
+# Session pools per event loop; a session can only be used on the loop that opened it.
+_pools: dict[asyncio.AbstractEventLoop, _SessionPool] = {}
+
+
+def _run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop, closing its sessions after."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("Cannot block inside a running event loop; await the async API.")
+
+    return asyncio.run(coro)
+
+
+def _make_getter(path: Sequence[str]) -> Callable[[Any], Any]:
+    """Return a function that walks a fixed key path into a nested response."""
+    keys = tuple(path)
+    return lambda data: functools.reduce(operator.getitem, keys, data)
+
+
+async def _close_pool_on_shutdown(
+    loop: asyncio.AbstractEventLoop, pool: _SessionPool
+) -> AsyncGenerator[None]:
+    """Close pool when its loop finalizes async generators (asyncio.run does on exit)."""
+    try:
+        yield
+    finally:
+        if _pools.get(loop) is pool:
+            del _pools[loop]
+        await pool.close()
+
+
+async def _get_pool() -> _SessionPool:
+    """Return the session pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        for old in [lp for lp in list(_pools) if lp.is_closed()]:
+            # Closed without shutdown_asyncgens() or close_clients(); too late to await
+            if _pools.pop(old).sessions:
+                logger.warning("Event loop closed with open GraphQL sessions.")
+        pool = _pools[loop] = _SessionPool()
+        # The loop tracks started async generators and closes them on shutdown
+        pool.shutdown_hook = _close_pool_on_shutdown(loop, pool)
+        await anext(pool.shutdown_hook)
+    return pool
+
+
+async def close_clients() -> None:
+    """Close the pooled GraphQL client sessions of the running event loop.
+
+    Loops that shut down through `asyncio.run()` (or otherwise call
+    `shutdown_asyncgens()`) close their sessions automatically; call this to
+    release connections earlier, or before closing a loop by hand. Sessions still
+    in use by a query are closed when that query finishes.
+    """
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
 
 
 def handle_transport_errors(e: Exception, resource_name: str = "resource") -> str:
@@ -88,37 +210,37 @@ async def async_paged_query(
 
     Raises:
         ValueError: If page_info_path is None and pageInfo cannot be inferred.
+
+    Note:
+        The connection to each (url, api_key) pair is pooled and reused by later calls
+        on the same event loop. It is closed when the loop shuts down, or earlier by
+        `close_clients()`.
     """
-    headers = {"Authorization": f"Bearer {api_key}"}
-    transport = AIOHTTPTransport(url=url, headers=headers, ssl=True)
+    get_data = _make_getter(data_path)
+    get_page_info = _make_getter(
+        page_info_path if page_info_path is not None else [*data_path[:-1], "pageInfo"]
+    )
 
-    async with Client(transport=transport, fetch_schema_from_transport=False) as client:
+    pool = await _get_pool()
+    session = await pool.acquire(url, api_key)
+    try:
         collected: list[dict[str, Any]] = []
         after = None
 
         while True:
             variables = {"first": 100, "after": after}
-            response = await client.execute(query, variable_values=variables)
-
-            data: Any = response
-            for key in data_path:
-                data = data[key]
-            collected.extend(data)
-
-            if page_info_path is None:
-                try:
-                    page_info: Any = response
-                    for key in data_path[:-1]:
-                        page_info = page_info[key]
-                    page_info = page_info["pageInfo"]
-                except (KeyError, TypeError) as e:
-                    raise ValueError(
-                        "Could not infer page_info path. Please specify page_info_path."
-                    ) from e
-            else:
-                page_info: Any = response
-                for key in page_info_path:
-                    page_info = page_info[key]
+            response = await session.execute(query, variable_values=variables)
+
+            collected.extend(get_data(response))
+
+            try:
+                page_info = get_page_info(response)
+            except (KeyError, TypeError) as e:
+                if page_info_path is not None:
+                    raise
+                raise ValueError(
+                    "Could not infer page_info path. Please specify page_info_path."
+                ) from e
 
             if not page_info.get("hasNextPage"):
                 break
@@ -127,6 +249,13 @@ async def async_paged_query(
 
         logger.info(f"Fetched {len(collected)} records from {url}.")
         return collected
+    except _CONNECTION_ERRORS as e:
+        if not isinstance(e, TransportQueryError):
+            # Do not hand a possibly broken connection to the next caller
+            pool.evict(url, api_key, session)
+        raise
+    finally:
+        await pool.release(session)
 
 
 def paged_query(
@@ -137,8 +266,10 @@ def paged_query(
 ) -> list[dict[str, Any]]:
     """Execute a paginated GraphQL query synchronously and fetch all results.
 
-    This is a synchronous wrapper around async_paged_query that uses asyncio.run
-    to execute the asynchronous query in a blocking manner.
+    This is a synchronous wrapper around async_paged_query. Each call runs on its own
+    event loop and closes its connection before returning, so it is safe to call from
+    any thread. To reuse connections across many queries, await async_paged_query
+    from one event loop instead.
 
     Args:
         url (str): The GraphQL endpoint URL.
@@ -151,7 +282,7 @@ def paged_query(
             or empty list if an error occurs.
     """
     try:
-        return asyncio.run(async_paged_query(url, api_key, query, data_path))
+        return _run_sync(async_paged_query(url, api_key, query, data_path))
     except Exception as e:
         handle_transport_errors(e, resource_name=url)
         return []
@@ -192,17 +323,16 @@ async def fetch_paginated(
         - Logs the total number of records fetched upon completion
     """
     all_results: list[dict[str, Any]] = []
+    base_vars = dict(variables) if variables else {}
     after = None
 
     while True:
-        page_vars = dict(variables) if variables else {}
-        page_vars.update({"first": 100, "after": after})
-
+        # A new dict per request, so transports that keep a reference see stable values
+        page_vars = {**base_vars, "first": 100, "after": after}
         response = await client.execute_async(query, variable_values=page_vars)
         page = response[data_key]
-        edges = page.get("edges", [])
 
-        all_results.extend(edge["node"] for edge in edges)
+        all_results.extend(map(_get_node, page.get("edges", ())))
 
         if not page.get("pageInfo", {}).get("hasNextPage"):
             break
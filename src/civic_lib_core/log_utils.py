@@ -32,14 +32,13 @@ def init_logger(log_level: str | None = None, log_to_console: bool = True) -> No
     """
     global _logger_initialized
     if _logger_initialized:
-        logger.debug("Logger already initialized.")  # type: ignore[attr-defined]
         return
 
     # Remove default handlers
     logger.remove()  # type: ignore[attr-defined]
 
-    layout = fs_utils.discover_project_layout()
-    project_root = layout.project_root
+    # Only the root is needed here; skip the docs/source/package scan of full layout discovery
+    project_root = fs_utils.get_project_root()
 
     try:
         policy = project_policy.load_project_policy(project_root)
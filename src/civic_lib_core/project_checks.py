@@ -4,9 +4,14 @@ Run structural and policy checks on a Civic Interconnect project.
 
 """
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import os
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from civic_lib_core import fs_utils, project_policy
+from civic_lib_core import fs_utils
 
 __all__ = [
     "check_additional_files",
@@ -17,16 +22,122 @@ __all__ = [
     "check_python_project_files",
     "check_required_files",
     "run_all_checks",
+    "scan_top_level",
 ]
 
+# Read size used when counting lines in source files
+_READ_CHUNK_SIZE = 64 * 1024
 
-def check_additional_files(project_root: Path, policy: dict, key: str) -> list[str]:
+# Below this many files, thread start-up costs more than overlapping reads saves
+_PARALLEL_MIN_FILES = 16
+
+
+class _TreeScan(NamedTuple):
+    """Paths collected by one walk of the project tree."""
+
+    empty_dirs: list[str]
+    src_py_files: list[str]
+    outside_py_files: list[str]
+
+
+def _entry_path_for(top: str, path: Path | None) -> str | None:
+    """Spell path the way scandir entries under top will, so it can be matched by string."""
+    if path is None:
+        return None
+    rel = os.path.relpath(path, top)
+    # os.path.join is how scandir builds DirEntry.path, so the spellings match exactly
+    return top if rel == os.curdir else os.path.join(top, rel)  # noqa: PTH118
+
+
+def _walk_once(root: Path, src_dir: Path | None) -> _TreeScan:
+    """Walk the tree under root once, collecting what the tree-based checks need.
+
+    Each directory is read with a single scandir call, and the cached DirEntry type
+    information is reused instead of stat-ing each path again. Symlinked directories
+    are not followed, as with Path.rglob. Directories are pruned by the same rule as
+    package discovery in fs_utils: caches and hidden directories at any depth, build
+    output and environment directories only directly under root, and never inside
+    src_dir.
+
+    Args:
+        root (Path): Directory to walk.
+        src_dir (Path | None): Source directory; .py files below it are collected
+            separately from those elsewhere under root.
+
+    Returns:
+        _TreeScan: Empty directories, .py files in src_dir, and .py files outside
+            src_dir (excluding top-level scripts in root).
+    """
+    top = os.fspath(root)
+    src_path = _entry_path_for(top, src_dir)
+
+    scan = _TreeScan([], [], [])
+    stack = [(top, top == src_path)]
+    while stack:
+        path, in_src = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        if not entries and path != top:
+            scan.empty_dirs.append(path)
+        top_level = path == top and not in_src
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not fs_utils.is_pruned_dir(entry.name, top_level):
+                    stack.append((entry.path, in_src or entry.path == src_path))
+            elif entry.name.endswith(".py") and entry.is_file():
+                if in_src:
+                    scan.src_py_files.append(entry.path)
+                elif path != top:
+                    scan.outside_py_files.append(entry.path)
+
+    return _TreeScan(*map(sorted, scan))
+
+
+def scan_top_level(project_root: Path) -> dict[str, os.DirEntry[str]]:
+    """List the top-level entries of a project with a single directory read.
+
+    Args:
+        project_root (Path): Project root.
+
+    Returns:
+        dict[str, os.DirEntry]: Entries keyed by name, or empty if unreadable.
+    """
+    try:
+        with os.scandir(project_root) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _exists(project_root: Path, name: str, entries: Mapping[str, os.DirEntry[str]] | None) -> bool:
+    """Return True if name exists under project_root, using entries when possible."""
+    if entries is None or "/" in name or os.sep in name:
+        return (project_root / name).exists()
+    entry = entries.get(name)
+    if entry is None:
+        # The listing is case-sensitive; on macOS/Windows README.md may be listed as readme.md
+        return (project_root / name).exists()
+    # A symlink is listed even when its target is missing; exists() would say no
+    return not entry.is_symlink() or Path(entry.path).exists()
+
+
+def check_additional_files(
+    project_root: Path,
+    policy: Mapping[str, Any],
+    key: str,
+    entries: Mapping[str, os.DirEntry[str]] | None = None,
+) -> list[str]:
     """Check additional file requirements from project policy.
 
     Args:
         project_root (Path): Project root.
-        policy (dict): Project policy.
+        policy (Mapping[str, Any]): Project policy.
         key (str): Policy key like 'node_project_files' or 'pwa_project_files'.
+        entries (Mapping[str, os.DirEntry] | None): Top-level entries of project_root,
+            as returned by scan_top_level; looked up instead of stat-ing each path.
 
     Returns:
         list[str]: Issues for missing files.
@@ -34,7 +145,7 @@ def check_additional_files(project_root: Path, policy: dict, key: str) -> list[s
     issues = []
     required = policy.get(key, [])
     for filename in required:
-        if not (project_root / filename).exists():
+        if not _exists(project_root, filename, entries):
             issues.append(f"Missing {key.replace('_', ' ')} file: {filename}")
     return issues
 
@@ -48,40 +159,109 @@ def check_empty_dirs(project_root: Path) -> list[str]:
     Returns:
         list[str]: Issues for empty directories.
     """
-    issues = []
-    for path in project_root.rglob("*"):
-        if path.is_dir() and not any(path.iterdir()):
-            issues.append(f"Empty directory found: {path.relative_to(project_root)}")
-    return issues
+    return _empty_dir_issues(project_root, _walk_once(project_root, None).empty_dirs)
+
+
+def _empty_dir_issues(project_root: Path, empty_dirs: list[str]) -> list[str]:
+    """Format issues for empty directories found by _walk_once."""
+    return [f"Empty directory found: {rel}" for rel in _strip_root(project_root, empty_dirs)]
+
+
+def _strip_root(project_root: Path, paths: list[str]) -> list[str]:
+    """Make paths from _walk_once(project_root) relative by slicing off the root prefix.
+
+    Walk paths always start with the root as given, so this avoids building a Path
+    and calling relative_to() for every reported entry.
+    """
+    prefix = os.fspath(project_root)
+    if not prefix.endswith(os.sep):
+        prefix += os.sep
+    return [path[len(prefix) :] for path in paths]
 
 
-def check_oversized_py_files(project_root: Path, src_dir: Path, policy: dict) -> list[str]:
+def check_oversized_py_files(
+    project_root: Path, src_dir: Path, policy: Mapping[str, Any]
+) -> list[str]:
     """Check for Python files exceeding allowed line limits.
 
     Args:
         project_root (Path): Project root.
         src_dir (Path): Source directory.
-        policy (dict): Project policy.
+        policy (Mapping[str, Any]): Project policy.
 
     Returns:
         list[str]: Issues for oversized files.
     """
+    return _oversized_py_file_issues(
+        project_root, _walk_once(src_dir, src_dir).src_py_files, policy
+    )
+
+
+def _oversized_py_file_issues(
+    project_root: Path, py_files: list[str], policy: Mapping[str, Any]
+) -> list[str]:
+    """Format issues for source files longer than the policy allows."""
     issues = []
     max_py_length = policy.get("max_python_file_length", 1000)
+    paths = [Path(path) for path in py_files]
 
-    for py_file in src_dir.rglob("*.py"):
-        try:
-            lines = py_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-            if len(lines) > max_py_length:
-                issues.append(
-                    f"Python file too long ({len(lines)} lines): {py_file.relative_to(project_root)}"
-                )
-        except Exception as e:
-            issues.append(f"Could not read file {py_file}: {e}")
+    for py_file, line_count in zip(paths, _count_lines_all(paths), strict=True):
+        if isinstance(line_count, OSError):
+            issues.append(f"Could not read file {py_file}: {line_count}")
+        elif line_count > max_py_length:
+            issues.append(
+                f"Python file too long ({line_count} lines): {_relative_to_root(py_file, project_root)}"
+            )
 
     return issues
 
 
+def _relative_to_root(path: Path, project_root: Path) -> Path:
+    """Return path relative to project_root, or unchanged if it lies outside the root."""
+    try:
+        return path.relative_to(project_root)
+    except ValueError:
+        return path
+
+
+def _count_lines_all(paths: list[Path]) -> list[int | OSError]:
+    """Count lines in each file, reading files concurrently when there are many.
+
+    File reads release the GIL, so threads overlap the I/O wait. A file that cannot
+    be read yields its OSError in place of a count, for the caller to report.
+    """
+    if len(paths) < _PARALLEL_MIN_FILES:
+        return [_count_lines_or_error(path) for path in paths]
+    workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_count_lines_or_error, paths))
+
+
+def _count_lines_or_error(path: Path) -> int | OSError:
+    """Return _count_lines(path), or the error raised while reading it."""
+    try:
+        return _count_lines(path)
+    except OSError as e:
+        return e
+
+
+def _count_lines(path: Path) -> int:
+    """Count lines in a file without decoding it or holding it in memory.
+
+    Counts newline (LF) bytes, plus one for a final line without a trailing newline.
+    Unlike str.splitlines(), a lone CR or other Unicode line boundaries such as form
+    feed are not treated as line breaks.
+    """
+    buf = bytearray(_READ_CHUNK_SIZE)
+    line_count = 0
+    ends_with_newline = True
+    with path.open("rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            line_count += buf.count(b"\n", 0, n)
+            ends_with_newline = buf[n - 1] == 0x0A
+    return line_count if ends_with_newline else line_count + 1
+
+
 def check_py_files_outside_src(project_root: Path, src_dir: Path) -> list[str]:
     """Check for .py files outside src_dir, ignoring top-level scripts.
 
@@ -92,64 +272,81 @@ def check_py_files_outside_src(project_root: Path, src_dir: Path) -> list[str]:
     Returns:
         list[str]: Issues for files outside src.
     """
-    issues = []
-    for py_file in project_root.rglob("*.py"):
-        if src_dir in py_file.parents:
-            continue
-        # Ignore top-level scripts in the repo root
-        if py_file.parent == project_root:
-            continue
-        issues.append(f"Python file outside src/ directory: {py_file.relative_to(project_root)}")
-    return issues
+    return _outside_src_issues(project_root, _walk_once(project_root, src_dir).outside_py_files)
+
 
+def _outside_src_issues(project_root: Path, py_files: list[str]) -> list[str]:
+    """Format issues for .py files found outside the source directory."""
+    return [
+        f"Python file outside src/ directory: {rel}" for rel in _strip_root(project_root, py_files)
+    ]
 
-def check_python_project_dirs(project_root: Path, policy: dict) -> list[str]:
+
+def check_python_project_dirs(
+    project_root: Path,
+    policy: Mapping[str, Any],
+    entries: Mapping[str, os.DirEntry[str]] | None = None,
+) -> list[str]:
     """Check required directories for Python projects.
 
     Args:
         project_root (Path): Project root.
-        policy (dict): Project policy.
+        policy (Mapping[str, Any]): Project policy.
+        entries (Mapping[str, os.DirEntry] | None): Top-level entries of project_root,
+            as returned by scan_top_level; looked up instead of stat-ing each path.
 
     Returns:
         list[str]: Issues for missing dirs.
     """
     issues = []
     for dirname in policy.get("python_project_dirs", []):
-        if not (project_root / dirname).exists():
+        if not _exists(project_root, dirname, entries):
             issues.append(f"Missing Python project directory: {dirname}/")
     return issues
 
 
-def check_python_project_files(project_root: Path, policy: dict) -> list[str]:
+def check_python_project_files(
+    project_root: Path,
+    policy: Mapping[str, Any],
+    entries: Mapping[str, os.DirEntry[str]] | None = None,
+) -> list[str]:
     """Check required files for Python projects.
 
     Args:
         project_root (Path): Project root.
-        policy (dict): Project policy.
+        policy (Mapping[str, Any]): Project policy.
+        entries (Mapping[str, os.DirEntry] | None): Top-level entries of project_root,
+            as returned by scan_top_level; looked up instead of stat-ing each path.
 
     Returns:
         list[str]: Issues for missing files.
     """
     issues = []
     for filename in policy.get("python_project_files", []):
-        if not (project_root / filename).exists():
+        if not _exists(project_root, filename, entries):
             issues.append(f"Missing Python project file: {filename}")
     return issues
 
 
-def check_required_files(project_root: Path, policy: dict) -> list[str]:
+def check_required_files(
+    project_root: Path,
+    policy: Mapping[str, Any],
+    entries: Mapping[str, os.DirEntry[str]] | None = None,
+) -> list[str]:
     """Check files required in all Civic Interconnect repos.
 
     Args:
         project_root (Path): Project root.
-        policy (dict): Project policy.
+        policy (Mapping[str, Any]): Project policy.
+        entries (Mapping[str, os.DirEntry] | None): Top-level entries of project_root,
+            as returned by scan_top_level; looked up instead of stat-ing each path.
 
     Returns:
         list[str]: Issues for missing required files.
     """
     issues = []
     for filename in policy.get("required_files", []):
-        if not (project_root / filename).exists():
+        if not _exists(project_root, filename, entries):
             issues.append(f"Missing required file: {filename}")
     return issues
 
@@ -160,33 +357,45 @@ def run_all_checks() -> list[str]:
     Returns:
         list[str]: List of issues found.
     """
-    issues = []
-
-    project_root = fs_utils.get_project_root()
-    policy = project_policy.load_project_policy(project_root)
+    # The layout is cached per project root and already carries the loaded policy
     layout = fs_utils.discover_project_layout()
-    src_dir = getattr(layout, "src_dir", None)
+    project_root = layout.project_root
+    policy = layout.policy
+    src_dir = layout.src_dir
 
-    issues.extend(check_required_files(project_root, policy))
+    has_src = isinstance(src_dir, Path)
 
-    # Check Python-specific files
-    if isinstance(src_dir, Path):
-        issues.extend(check_python_project_files(project_root, policy))
-        issues.extend(check_python_project_dirs(project_root, policy))
-        issues.extend(check_oversized_py_files(project_root, src_dir, policy))
-        issues.extend(check_py_files_outside_src(project_root, src_dir))
-    else:
-        issues.append("No source directory found. Skipping Python file checks.")
+    # One walk of the tree feeds the empty-dir, oversized and outside-src checks,
+    # and one read of the root answers every required-file lookup
+    scan = _walk_once(project_root, src_dir if has_src else None)
+    entries = scan_top_level(project_root)
 
-    # Check Node.js files if applicable
-    issues.extend(check_additional_files(project_root, policy, key="node_project_files"))
+    # Each check returns its own list; they are flattened once at the end
+    issue_lists = [check_required_files(project_root, policy, entries)]
 
-    # Check PWA files if applicable
-    issues.extend(check_additional_files(project_root, policy, key="pwa_project_files"))
+    # Check Python-specific files
+    if has_src:
+        src_py_files = scan.src_py_files
+        if os.path.relpath(src_dir, project_root).startswith(os.pardir):
+            src_py_files = _walk_once(src_dir, src_dir).src_py_files
+        issue_lists += [
+            check_python_project_files(project_root, policy, entries),
+            check_python_project_dirs(project_root, policy, entries),
+            _oversized_py_file_issues(project_root, src_py_files, policy),
+            _outside_src_issues(project_root, scan.outside_py_files),
+        ]
+    else:
+        issue_lists.append(["No source directory found. Skipping Python file checks."])
 
-    issues.extend(check_empty_dirs(project_root))
+    issue_lists += [
+        # Check Node.js files if applicable
+        check_additional_files(project_root, policy, key="node_project_files", entries=entries),
+        # Check PWA files if applicable
+        check_additional_files(project_root, policy, key="pwa_project_files", entries=entries),
+        _empty_dir_issues(project_root, scan.empty_dirs),
+    ]
 
-    return issues
+    return list(itertools.chain.from_iterable(issue_lists))
 
 
 def main() -> None:
@@ -4,7 +4,8 @@ Discover and verify basic project layout for any Civic Interconnect client repo.
 """
 
 from pathlib import Path
-from typing import NamedTuple
+import stat
+from typing import Any, NamedTuple
 
 from civic_lib_core import fs_utils
 
@@ -26,7 +27,7 @@ class ProjectLayout(NamedTuple):
         docs_api_dir (Path | None): API documentation source directory, or None if not found.
         packages (list[Path]): List of package directories under src_dir.
         org_name (str | None): Organization name, if detected.
-        policy (dict): Loaded project policy data.
+        policy (dict[str, Any]): Loaded project policy data.
     """
 
     project_root: Path
@@ -35,7 +36,7 @@ class ProjectLayout(NamedTuple):
     docs_api_dir: Path | None
     packages: list[Path]
     org_name: str | None
-    policy: dict
+    policy: dict[str, Any]
 
 
 def discover_project_layout() -> ProjectLayout:
@@ -73,6 +74,14 @@ def format_layout(layout: ProjectLayout) -> str:
     return "\n".join(parts)
 
 
+def _is_dir(path: Path) -> bool | None:
+    """Return whether path is a directory, or None if it does not exist (one stat call)."""
+    try:
+        return stat.S_ISDIR(path.stat().st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def verify_layout(layout: ProjectLayout) -> list[str]:
     """Verify that the discovered layout satisfies expectations.
 
@@ -84,23 +93,26 @@ def verify_layout(layout: ProjectLayout) -> list[str]:
     """
     errors: list[str] = []
 
-    if not layout.project_root.exists():
+    root_is_dir = _is_dir(layout.project_root)
+    if root_is_dir is None:
         errors.append(f"Project root not found: {layout.project_root}")
-    elif not layout.project_root.is_dir():
+    elif not root_is_dir:
         errors.append(f"Project root is not a directory: {layout.project_root}")
 
     if layout.src_dir:
-        if not layout.src_dir.exists():
+        src_is_dir = _is_dir(layout.src_dir)
+        if src_is_dir is None:
             errors.append(f"Missing source directory: {layout.src_dir}")
-        elif not layout.src_dir.is_dir():
+        elif not src_is_dir:
             errors.append(f"Source directory is not a directory: {layout.src_dir}")
         elif not layout.packages:
             errors.append(f"No Python packages found under: {layout.src_dir}")
 
     if layout.docs_api_dir:
-        if not layout.docs_api_dir.exists():
+        api_is_dir = _is_dir(layout.docs_api_dir)
+        if api_is_dir is None:
             errors.append(f"Missing API docs source directory: {layout.docs_api_dir}")
-        elif not layout.docs_api_dir.is_dir():
+        elif not api_is_dir:
             errors.append(f"API docs source directory is not a directory: {layout.docs_api_dir}")
 
     return errors
@@ -4,6 +4,8 @@ Load the project policy for any Civic Interconnect client repo.
 
 """
 
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Any
@@ -18,9 +20,10 @@ DEFAULT_POLICY_PATH = Path(__file__).parent / "project_policy.yaml"
 
 
 def _deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
-    """Recursively merge dict2 into dict1.
+    """Deep-merge dict2 into dict1 without modifying either.
 
-    Values from dict2 overwrite values from dict1.
+    Values from dict2 overwrite values from dict1. Only the nested dicts that dict2
+    touches are copied; untouched subtrees are shared with dict1.
 
     Args:
         dict1: The base dictionary.
@@ -30,14 +33,37 @@ def _deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str,
         dict: A merged dictionary.
     """
     merged_dict = dict1.copy()
-    for key, value in dict2.items():
-        if key in merged_dict and isinstance(merged_dict[key], dict) and isinstance(value, dict):
-            merged_dict[key] = _deep_merge_dicts(merged_dict[key], value)
-        else:
-            merged_dict[key] = value
+    stack = [(merged_dict, dict2)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     return merged_dict
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_policy_file(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a policy YAML file; the mtime and size key drops the entry once it changes."""
+    with path.open(encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _read_policy_file(path: Path) -> dict[str, Any]:
+    """Return a private copy of a policy file's contents, parsing it only when it has changed.
+
+    The parsed data is cached by modification time and size, so a rewrite within one
+    coarse timestamp tick is still seen if the length changed; the copy keeps callers
+    from mutating the cached entry.
+    """
+    st = path.stat()
+    return copy.deepcopy(_parse_policy_file(path, st.st_mtime_ns, st.st_size))
+
+
 def load_project_policy(
     project_root: Path | None = None,
     override_file: Path | None = None,
@@ -54,12 +80,12 @@ def load_project_policy(
         override_file: Optional path to explicitly provide a custom policy file.
 
     Returns:
-        dict: Combined policy dictionary.
+        dict: Combined policy dictionary. Each call returns a new dictionary; policy
+            files are only re-parsed after they change on disk.
     """
     # Load default policy
     try:
-        with DEFAULT_POLICY_PATH.open(encoding="utf-8") as f:
-            policy_data = yaml.safe_load(f) or {}
+        policy_data = _read_policy_file(DEFAULT_POLICY_PATH)
     except FileNotFoundError:
         logger.warning(f"Default policy file not found at {DEFAULT_POLICY_PATH}")
         policy_data = {}
@@ -77,8 +103,7 @@ def load_project_policy(
 
     if custom_policy_path and custom_policy_path.exists():
         try:
-            with custom_policy_path.open(encoding="utf-8") as f:
-                custom_data = yaml.safe_load(f) or {}
+            custom_data = _read_policy_file(custom_policy_path)
 
             policy_data = _deep_merge_dicts(policy_data, custom_data)
             policy_data["__policy_path__"] = str(custom_policy_path)
@@ -26,7 +26,7 @@ def archive_old_reports(agent_dir: Path, keep_latest: bool = True) -> list[Path]
     Returns:
         list[Path]: List of archived report file paths.
     """
-    if not agent_dir.exists() or not agent_dir.is_dir():
+    if not agent_dir.is_dir():
         logger.warning(f"Agent report directory does not exist: {agent_dir}")
         return []
 
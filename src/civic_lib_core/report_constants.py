@@ -11,9 +11,8 @@ from pathlib import Path
 # Path-related constants
 # ----------------------
 
-# Root directory where reports are stored
+# Root directory where reports are stored (created by the writers that need it)
 REPORTS_DIR = Path("reports")
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Path to the top-level index file listing latest agent reports
 OUTPUT_FILE = REPORTS_DIR / "index.md"
@@ -9,7 +9,7 @@ import csv
 import io
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, overload
 
 __all__ = [
     "format_report_as_csv",
@@ -20,28 +20,52 @@ __all__ = [
 ]
 
 
-def format_report_as_csv(report: dict[str, Any]) -> str:
-    """Format a report dictionary as a CSV string.
+@overload
+def format_report_as_csv(report: dict[str, Any], out: None = None) -> str: ...
+
+
+@overload
+def format_report_as_csv(report: dict[str, Any], out: TextIO) -> None: ...
+
+
+def format_report_as_csv(report: dict[str, Any], out: TextIO | None = None) -> str | None:
+    """Format a report dictionary as CSV.
 
     Args:
         report (dict): A dictionary containing report data with a 'results' key
                       that holds a list of dictionaries to be formatted as CSV.
+        out (TextIO | None): Optional open text stream to write the CSV to, so large
+                      reports are not built up in memory first. Files should be
+                      opened with newline="".
 
     Returns:
-        str: A CSV-formatted string with headers and data rows, or a message
-             indicating no results are available if the results list is empty.
+        str | None: If out is None, a CSV-formatted string with headers and data rows,
+             or a message indicating no results are available if the results list
+             is empty. Otherwise None, with the same content written to out.
     """
     results = report.get("results", [])
+    if out is not None:
+        if results:
+            _write_csv(results, out)
+        else:
+            out.write("No results to export.")
+        return None
+
     if not results:
         return "No results to export."
 
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=results[0].keys())
-    writer.writeheader()
-    writer.writerows(results)
+    _write_csv(results, output)
     return output.getvalue()
 
 
+def _write_csv(rows: list[dict[str, Any]], out: TextIO) -> None:
+    """Write rows to out as CSV, taking the header from the first row's keys."""
+    writer = csv.DictWriter(out, fieldnames=rows[0].keys())
+    writer.writeheader()
+    writer.writerows(rows)
+
+
 def format_report_as_markdown(report: dict[str, Any]) -> str:
     """Format a report dictionary as a markdown string.
 
@@ -172,9 +196,7 @@ def to_csv(data: list[dict[str, Any]], path: Path) -> None:
         return
 
     with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
+        _write_csv(data, f)
 
 
 def to_markdown(data: list[dict[str, Any]], path: Path) -> None:
@@ -205,12 +227,12 @@ def to_markdown(data: list[dict[str, Any]], path: Path) -> None:
         return
 
     headers = list(data[0].keys())
-    lines = ["| " + " | ".join(headers) + " |"]
-    lines.append("|" + "|".join(["---"] * len(headers)) + "|")
+    header_line = "| " + " | ".join(headers) + " |"
+    separator_line = "|" + "|".join(["---"] * len(headers)) + "|"
 
-    for row in data:
-        # Escape any pipe characters to preserve Markdown table
-        row_values = [str(row[h]).replace("|", "\\|") for h in headers]
-        lines.append("| " + " | ".join(row_values) + " |")
+    # Escape any pipe characters to preserve Markdown table
+    rows = [
+        "| " + " | ".join([str(row[h]).replace("|", "\\|") for h in headers]) + " |" for row in data
+    ]
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    path.write_text("\n".join([header_line, separator_line, *rows]), encoding="utf-8")
@@ -5,13 +5,14 @@ Used by dashboards, CLI tools, and indexing utilities.
 
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Any
 
 from civic_lib_core import log_utils
 from civic_lib_core.report_constants import EXPECTED_REPORT_KEYS, REPORT_EXTENSION
-from civic_lib_core.report_utils import is_report_file
+from civic_lib_core.report_utils import is_report_name
+from civic_lib_core.schema_utils import load_json
 
 __all__ = [
     "get_latest_report",
@@ -31,11 +32,19 @@ def get_latest_report(agent_dir: Path) -> Path | None:
     Returns:
         Path | None: The latest report file, or None if none found.
     """
-    report_files = sorted(
-        (f for f in agent_dir.glob(f"*{REPORT_EXTENSION}") if is_report_file(f)),
-        reverse=True,
-    )
-    latest = report_files[0] if report_files else None
+    try:
+        with os.scandir(agent_dir) as it:
+            latest_name = max(
+                (
+                    entry.name
+                    for entry in it
+                    if entry.name.endswith(REPORT_EXTENSION) and is_report_name(entry.name)
+                ),
+                default=None,
+            )
+    except OSError:
+        latest_name = None
+    latest = agent_dir / latest_name if latest_name else None
 
     if latest:
         logger.debug(f"Latest report for {agent_dir.name}: {latest.name}")
@@ -65,7 +74,7 @@ def read_latest_report(agent_dir: Path, strict: bool = False) -> dict[str, Any]
         return None
 
     try:
-        data = json.loads(latest.read_text(encoding="utf-8"))
+        data = load_json(latest)
     except Exception as e:
         msg = f"Failed to read report: {latest} — {e}"
         if strict:
@@ -92,8 +101,7 @@ def validate_report_format(report: dict[str, Any]) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    keys = set(report.keys())
-    missing = EXPECTED_REPORT_KEYS - keys
+    missing = EXPECTED_REPORT_KEYS - report.keys()
     if missing:
         logger.warning(f"Report missing expected keys: {missing}")
         return False
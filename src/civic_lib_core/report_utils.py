@@ -8,7 +8,7 @@ Part of the Civic Interconnect agent framework.
 import datetime
 from pathlib import Path
 
-__all__ = ["get_agent_name_from_path", "is_report_file"]
+__all__ = ["get_agent_name_from_path", "is_report_file", "is_report_name"]
 
 
 def get_agent_name_from_path(path: Path) -> str:
@@ -42,10 +42,25 @@ def is_report_file(path: Path) -> bool:
     Returns:
         bool: True if the path matches report file format, False otherwise.
     """
-    if path.suffix != ".json":
+    return is_report_name(path.name)
+
+
+def is_report_name(name: str) -> bool:
+    """Determine whether a bare file name matches the report file format.
+
+    Same rules as is_report_file, for callers (such as directory scans) that
+    already have the name as a string and need not build a Path.
+
+    Args:
+        name (str): The file name to check.
+
+    Returns:
+        bool: True if the name matches report file format, False otherwise.
+    """
+    if not name.endswith(".json") or name == ".json":
         return False
     try:
-        datetime.date.fromisoformat(path.stem[:10])
+        datetime.date.fromisoformat(name[:-5][:10])
         return True
     except ValueError:
         return False
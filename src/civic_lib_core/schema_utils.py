@@ -12,6 +12,12 @@ from typing import Any
 
 from civic_lib_core import log_utils
 
+try:
+    # Optional C parser (civic-lib-core[fast]); reads bytes without a str copy
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    from json import loads as _json_loads
+
 __all__ = ["detect_schema_change", "hash_dict", "load_json"]
 
 logger = log_utils.logger
@@ -69,7 +75,13 @@ def load_json(path: str | Path) -> dict[str, Any]:
         json.JSONDecodeError: If the file is not valid JSON.
     """
     path = Path(path)
-    with path.open(encoding="utf-8") as f:
-        data = json.load(f)
+    raw = path.read_bytes()
+    try:
+        data = _json_loads(raw)
+    except json.JSONDecodeError:
+        if _json_loads is json.loads:
+            raise
+        # orjson rejects NaN/Infinity and integers wider than 64 bits; json.dumps writes them
+        data = json.loads(raw)
     logger.debug(f"Loaded JSON from {path}")
     return data
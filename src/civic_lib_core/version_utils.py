@@ -13,66 +13,73 @@ repos.
 
 """
 
+import functools
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_python_version
 import json
 from pathlib import Path
 import tomllib
 
-from civic_lib_core import fs_utils, log_utils
+from loguru import logger
 
-__all__ = ["get_repo_version"]
+from civic_lib_core import fs_utils
 
-logger = log_utils.logger
+__all__ = ["get_repo_version"]
 
 
+@functools.lru_cache(maxsize=8)
 def get_version_from_python_metadata(package_name: str) -> str | None:
-    """Try reading the version from installed Python package metadata."""
+    """Try reading the version from installed Python package metadata.
+
+    Results are cached per package name: metadata lookups scan every distribution on
+    sys.path, and installed metadata only changes when the package is reinstalled.
+    """
     try:
         version_str = get_python_version(package_name)
-        logger.info(f"Version found via Python metadata: {version_str}")
+        logger.info("Version found via Python metadata: {}", version_str)
         return version_str
     except PackageNotFoundError:
-        logger.debug(f"Package {package_name} not installed.")
+        logger.debug("Package {} not installed.", package_name)
     except Exception as e:
-        logger.warning(f"Unexpected error reading Python version metadata: {e}")
+        logger.warning("Unexpected error reading Python version metadata: {}", e)
     return None
 
 
 def get_version_from_files(root: Path) -> str | None:
     """Check pyproject.toml, VERSION, or package.json for the project version."""
-    pyproject = root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            with pyproject.open("rb") as f:
-                data = tomllib.load(f)
-            version_str = data.get("project", {}).get("version")
-            if version_str:
-                logger.info(f"Version found in pyproject.toml: {version_str}")
-                return version_str
-        except Exception as e:
-            logger.warning(f"Error parsing pyproject.toml: {e}")
-
-    version_file = root / "VERSION"
-    if version_file.exists():
-        try:
-            version_str = version_file.read_text(encoding="utf-8").strip()
-            if version_str:
-                logger.info(f"Version found in VERSION file: {version_str}")
-                return version_str
-        except Exception as e:
-            logger.warning(f"Error reading VERSION file: {e}")
-
-    package_json = root / "package.json"
-    if package_json.exists():
-        try:
-            data = json.loads(package_json.read_text(encoding="utf-8"))
-            version_str = data.get("version")
-            if version_str:
-                logger.info(f"Version found in package.json: {version_str}")
-                return version_str
-        except Exception as e:
-            logger.warning(f"Error reading package.json: {e}")
+    # Open each candidate directly; a missing file costs one failed open, not a stat too
+    try:
+        with (root / "pyproject.toml").open("rb") as f:
+            data = tomllib.load(f)
+        version_str = data.get("project", {}).get("version")
+        if version_str:
+            logger.info("Version found in pyproject.toml: {}", version_str)
+            return version_str
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Error parsing pyproject.toml: {}", e)
+
+    try:
+        version_str = (root / "VERSION").read_text(encoding="utf-8").strip()
+        if version_str:
+            logger.info("Version found in VERSION file: {}", version_str)
+            return version_str
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Error reading VERSION file: {}", e)
+
+    try:
+        data = json.loads((root / "package.json").read_text(encoding="utf-8"))
+        version_str = data.get("version")
+        if version_str:
+            logger.info("Version found in package.json: {}", version_str)
+            return version_str
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Error reading package.json: {}", e)
 
     return None
 
@@ -88,6 +95,9 @@ def get_repo_version(
     3. VERSION file
     4. package.json.
 
+    Version files are read on every call, so a changed working directory or an
+    in-process version bump is picked up.
+
     Returns:
         str: The discovered version string, or "0.0.0" if none found.
     """
@@ -100,7 +110,7 @@ def get_repo_version(
     try:
         root = root_dir or fs_utils.get_project_root()
     except Exception as e:
-        logger.warning(f"Could not detect project root. Defaulting to cwd. Error: {e}")
+        logger.warning("Could not detect project root. Defaulting to cwd. Error: {}", e)
         root = Path.cwd()
 
     # 3. Check files in root
@@ -0,0 +1,54 @@
+"""
+Test cases for civic-lib-core.cli.bump_version module.
+"""
+
+from pathlib import Path
+
+from civic_lib_core.cli import bump_version
+
+
+def test_update_file_replaces_old_version(tmp_path: Path) -> None:
+    path = tmp_path / "VERSION"
+    path.write_text("1.2.3\n", encoding="utf-8")
+
+    assert bump_version.update_file(path, "1.2.3", "1.2.4")
+    assert path.read_text(encoding="utf-8") == "1.2.4\n"
+
+
+def test_update_file_leaves_unrelated_file_untouched(tmp_path: Path) -> None:
+    path = tmp_path / "README.md"
+    path.write_text("# Project\n", encoding="utf-8")
+    mtime = path.stat().st_mtime_ns
+
+    assert not bump_version.update_file(path, "1.2.3", "1.2.4")
+    assert not bump_version.update_file(tmp_path / "missing.toml", "1.2.3", "1.2.4")
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_update_file_preserves_line_endings(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(b'[project]\r\nversion = "1.2.3"\r\n')
+
+    assert bump_version.update_file(path, "1.2.3", "1.2.4")
+    assert path.read_bytes() == b'[project]\r\nversion = "1.2.4"\r\n'
+
+
+def test_update_file_only_bumps_project_version_in_pyproject(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text(
+        "[project]\n"
+        'name = "demo"\n'
+        'version = "1.2.3"\n'
+        'dependencies = ["other==1.2.3"]\n'
+        "\n"
+        "[tool.demo]\n"
+        'version = "1.2.3"\n',
+        encoding="utf-8",
+    )
+
+    assert bump_version.update_file(path, "1.2.3", "1.2.4")
+    content = path.read_text(encoding="utf-8")
+    assert 'version = "1.2.4"\ndependencies = ["other==1.2.3"]' in content
+    assert content.endswith('[tool.demo]\nversion = "1.2.3"\n')
+
+    assert not bump_version.update_file(path, "1.2.3", "1.2.5")
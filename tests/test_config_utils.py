@@ -47,3 +47,22 @@ def test_parse_version_valid():
 def test_parse_version_invalid():
     with pytest.raises(ValueError):
         config_utils.parse_version("version_x.y.z")
+
+
+def test_parse_version_with_suffix():
+    assert config_utils.parse_version("1.2.3rc1") == (1, 2, 3)
+    assert config_utils.parse_version("0.57.0-beta.2") == (0, 57, 0)
+    assert config_utils.parse_version("1.2.3+local.7") == (1, 2, 3)
+
+
+def test_parse_version_rejects_partial_or_padded():
+    for bad in ["1.2", "1.2.3 ", "1.2.3-", "v1.2.3", "1.2.3/4"]:
+        with pytest.raises(ValueError):
+            config_utils.parse_version(bad)
+
+
+def test_parse_version_caches_valid_results():
+    config_utils.parse_version.cache_clear()
+    first = config_utils.parse_version("4.5.6")
+    assert config_utils.parse_version("4.5.6") is first
+    assert config_utils.parse_version.cache_info().hits == 1
@@ -46,3 +46,124 @@ def test_ensure_dir_on_existing_directory():
         assert result.exists()
         assert result.is_dir()
         assert result == tmp_path
+
+
+def test_get_project_root_finds_marker_in_ancestor(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    assert fs_utils.get_project_root(nested) == tmp_path.resolve()
+
+
+def test_get_project_root_is_cached_until_cleared(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    nested = tmp_path / "pkg"
+    nested.mkdir()
+    fs_utils.clear_layout_cache()
+    assert fs_utils.get_project_root(nested) == tmp_path.resolve()
+
+    # A marker added later is not seen until the cache is cleared
+    (nested / "pyproject.toml").write_text("", encoding="utf-8")
+    assert fs_utils.get_project_root(nested) == tmp_path.resolve()
+
+    fs_utils.clear_layout_cache()
+    assert fs_utils.get_project_root(nested) == nested.resolve()
+
+
+def test_get_valid_packages_detects_regular_and_namespace_packages(tmp_path: Path):
+    (tmp_path / "regular").mkdir()
+    (tmp_path / "regular" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "namespace").mkdir()
+    (tmp_path / "namespace" / "module.py").write_text("", encoding="utf-8")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "notes.txt").write_text("", encoding="utf-8")
+    (tmp_path / "script.py").write_text("", encoding="utf-8")
+
+    packages = fs_utils.get_valid_packages(tmp_path)
+    assert sorted(p.name for p in packages) == ["namespace", "regular"]
+
+
+def test_get_valid_packages_is_cached_until_cleared(tmp_path: Path):
+    (tmp_path / "first").mkdir()
+    (tmp_path / "first" / "__init__.py").write_text("", encoding="utf-8")
+    fs_utils.clear_layout_cache()
+    assert [p.name for p in fs_utils.get_valid_packages(tmp_path)] == ["first"]
+
+    (tmp_path / "second").mkdir()
+    (tmp_path / "second" / "__init__.py").write_text("", encoding="utf-8")
+    assert [p.name for p in fs_utils.get_valid_packages(tmp_path)] == ["first"]
+
+    fs_utils.clear_layout_cache()
+    assert sorted(p.name for p in fs_utils.get_valid_packages(tmp_path)) == ["first", "second"]
+
+
+def test_safe_filename_non_ascii():
+    assert fs_utils.safe_filename("Ünïcödé Répört/Nämé ☃") == "ünïcödé_répört_nämé"
+    assert fs_utils.safe_filename("☃☃") == "file"
+
+
+def test_get_source_dir_uses_policy_src_dirs(tmp_path: Path):
+    (tmp_path / "lib" / "mypkg").mkdir(parents=True)
+    (tmp_path / "lib" / "mypkg" / "__init__.py").write_text("", encoding="utf-8")
+    policy = {"build": {"src_dirs": ["src", "lib"]}}
+
+    assert fs_utils.get_source_dir(tmp_path, policy) == tmp_path / "lib"
+    assert fs_utils.get_source_dir(tmp_path, {"build": {"src_dirs": ["src"]}}) is None
+
+
+def test_get_repo_package_names_prunes_non_source_dirs(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("")
+    for pkg in ["src/app", "src/app/sub", "src/.venv/lib/vendored", "src/build/lib/app_copy"]:
+        (tmp_path / pkg).mkdir(parents=True)
+        (tmp_path / pkg / "__init__.py").write_text("")
+
+    assert fs_utils.get_repo_package_names(tmp_path) == ["app", "app.sub"]
+
+
+def test_discover_project_layout_returns_independent_package_lists(tmp_path: Path, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "app").mkdir(parents=True)
+    (tmp_path / "src" / "app" / "__init__.py").write_text("", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    fs_utils.clear_layout_cache()
+
+    first = fs_utils.discover_project_layout()
+    first.packages.clear()
+    assert [p.name for p in fs_utils.discover_project_layout().packages] == ["app"]
+
+
+def test_get_source_dir_finds_src_created_after_a_miss(tmp_path: Path):
+    policy = {"build": {"src_dirs": ["src"]}}
+    assert fs_utils.get_source_dir(tmp_path, policy) is None
+    (tmp_path / "src").mkdir()
+    assert fs_utils.get_source_dir(tmp_path, policy) is None
+
+    (tmp_path / "src" / "newpkg").mkdir()
+    (tmp_path / "src" / "newpkg" / "__init__.py").write_text("", encoding="utf-8")
+    assert fs_utils.get_source_dir(tmp_path, policy) == tmp_path / "src"
+
+
+def test_get_source_dir_finds_package_populated_after_a_miss(tmp_path: Path):
+    policy = {"build": {"src_dirs": ["src"]}}
+    (tmp_path / "src" / "newpkg").mkdir(parents=True)
+    assert fs_utils.get_source_dir(tmp_path, policy) is None
+
+    (tmp_path / "src" / "newpkg" / "__init__.py").write_text("", encoding="utf-8")
+    assert fs_utils.get_source_dir(tmp_path, policy) == tmp_path / "src"
+    assert fs_utils.get_valid_packages(tmp_path / "src") == [tmp_path / "src" / "newpkg"]
+
+
+def test_get_repo_package_names_keeps_nested_build_subpackages(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("")
+    for pkg in ["src/app", "src/app/build", "src/app/dist", "src/app/venv", "src/app/.hidden"]:
+        (tmp_path / pkg).mkdir(parents=True)
+        (tmp_path / pkg / "__init__.py").write_text("")
+    (tmp_path / "src/app/__pycache__/x").mkdir(parents=True)
+    (tmp_path / "src/app/__pycache__/x/__init__.py").write_text("")
+
+    assert fs_utils.get_repo_package_names(tmp_path) == [
+        "app",
+        "app.build",
+        "app.dist",
+        "app.venv",
+    ]
@@ -2,6 +2,10 @@
 Test cases for civic-lib-core.graphql_utils module.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import threading
 from unittest.mock import patch
 
 from gql.transport.exceptions import (
@@ -54,3 +58,184 @@ def test_handle_generic_exception():
     with pytest.raises(Exception) as exc_info:
         graphql_utils.handle_transport_errors(error, resource_name="TestResource")
     assert str(exc_info.value) == "Something went wrong"
+
+
+class _FakeSession:
+    def __init__(self, client):
+        self.client = client
+
+    async def execute(self, query, variable_values=None):
+        return {"items": {"nodes": [{"id": 1}], "pageInfo": {"hasNextPage": False}}}
+
+
+@pytest.fixture
+def install_client(monkeypatch):
+    """Patch in a fake gql Client with fresh created/closed counters."""
+
+    def install(session_cls=_FakeSession):
+        class _FakeClient:
+            created = 0
+            closed = 0
+
+            def __init__(self, transport=None, fetch_schema_from_transport=False):
+                _FakeClient.created += 1
+
+            async def connect_async(self):
+                return session_cls(self)
+
+            async def close_async(self):
+                _FakeClient.closed += 1
+
+        monkeypatch.setattr(graphql_utils, "Client", _FakeClient)
+        monkeypatch.setattr(graphql_utils, "AIOHTTPTransport", lambda **kwargs: None)
+        return _FakeClient
+
+    return install
+
+
+def test_async_paged_query_reuses_session_per_endpoint(install_client):
+    client_cls = install_client()
+
+    async def run_queries():
+        for _ in range(3):
+            records = await graphql_utils.async_paged_query(
+                "https://fake.url/graphql", "key", {}, ["items", "nodes"]
+            )
+            assert records == [{"id": 1}]
+        await graphql_utils.close_clients()
+
+    asyncio.run(run_queries())
+    assert client_cls.created == 1
+    assert client_cls.closed == 1
+
+
+def test_async_paged_query_closes_session_when_loop_shuts_down(install_client):
+    client_cls = install_client()
+
+    records = asyncio.run(
+        graphql_utils.async_paged_query("https://fake.url/graphql", "key", {}, ["items", "nodes"])
+    )
+    assert records == [{"id": 1}]
+    assert client_cls.closed == 1
+    assert not graphql_utils._pools
+
+
+def test_async_paged_query_keeps_session_on_data_errors(install_client):
+    client_cls = install_client()
+
+    async def run_queries():
+        with pytest.raises(KeyError):
+            await graphql_utils.async_paged_query("https://fake.url/graphql", "key", {}, ["nope"])
+        records = await graphql_utils.async_paged_query(
+            "https://fake.url/graphql", "key", {}, ["items", "nodes"]
+        )
+        assert records == [{"id": 1}]
+        assert client_cls.closed == 0
+        await graphql_utils.close_clients()
+
+    asyncio.run(run_queries())
+    assert client_cls.created == 1
+    assert client_cls.closed == 1
+
+
+def test_async_paged_query_closes_broken_session_after_last_user(install_client):
+    class _FlakySession(_FakeSession):
+        async def execute(self, query, variable_values=None):
+            await asyncio.sleep(0)
+            if query == "broken":
+                raise TransportProtocolError("connection reset")
+            return await super().execute(query, variable_values)
+
+    client_cls = install_client(_FlakySession)
+
+    async def run_queries():
+        ok, broken = await asyncio.gather(
+            graphql_utils.async_paged_query(
+                "https://fake.url/graphql", "key", {}, ["items", "nodes"]
+            ),
+            graphql_utils.async_paged_query(
+                "https://fake.url/graphql", "key", "broken", ["items", "nodes"]
+            ),
+            return_exceptions=True,
+        )
+        assert ok == [{"id": 1}]
+        assert isinstance(broken, TransportProtocolError)
+        # The shared session is closed once, after both queries released it
+        assert client_cls.closed == 1
+
+        await graphql_utils.async_paged_query(
+            "https://fake.url/graphql", "key", {}, ["items", "nodes"]
+        )
+        assert client_cls.created == 2
+        await graphql_utils.close_clients()
+
+    asyncio.run(run_queries())
+    assert client_cls.closed == 2
+
+
+def test_paged_query_is_safe_to_call_from_concurrent_threads(install_client):
+    both_running = threading.Barrier(2, timeout=5)
+
+    class _SlowSession(_FakeSession):
+        async def execute(self, query, variable_values=None):
+            # Block this thread's loop until the other thread's query is in flight too
+            await asyncio.to_thread(both_running.wait)
+            return await super().execute(query, variable_values)
+
+    install_client(_SlowSession)
+
+    def query(_):
+        return graphql_utils.paged_query("https://fake.url/graphql", "key", {}, ["items", "nodes"])
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(query, range(2)))
+    assert results == [[{"id": 1}], [{"id": 1}]]
+
+
+_FD_DIR = Path("/proc/self/fd")
+
+
+@pytest.mark.skipif(not _FD_DIR.is_dir(), reason="needs /proc/self/fd")
+def test_paged_query_releases_loops_and_sessions_after_threads_exit(install_client):
+    client_cls = install_client()
+    fds_before = len(list(_FD_DIR.iterdir()))
+
+    def query():
+        graphql_utils.paged_query("https://fake.url/graphql", "key", {}, ["items", "nodes"])
+
+    for _ in range(20):
+        worker = threading.Thread(target=query)
+        worker.start()
+        worker.join()
+
+    assert client_cls.closed == client_cls.created == 20
+    assert not graphql_utils._pools
+    assert len(list(_FD_DIR.iterdir())) <= fds_before
+
+
+def test_fetch_paginated_collects_nodes_across_pages():
+    pages = [
+        {
+            "users": {
+                "edges": [{"node": {"id": 1}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            }
+        },
+        {"users": {"edges": [{"node": {"id": 2}}], "pageInfo": {"hasNextPage": False}}},
+    ]
+    seen_variables = []
+
+    class _PagingClient:
+        async def execute_async(self, query, variable_values=None):
+            # Keep the dict itself; it must not change after the request is made
+            seen_variables.append(variable_values)
+            return pages[len(seen_variables) - 1]
+
+    results = asyncio.run(
+        graphql_utils.fetch_paginated(_PagingClient(), {}, "users", {"status": "active"})
+    )
+    assert results == [{"id": 1}, {"id": 2}]
+    assert seen_variables == [
+        {"status": "active", "first": 100, "after": None},
+        {"status": "active", "first": 100, "after": "c1"},
+    ]
@@ -0,0 +1,123 @@
+"""
+Test cases for civic-lib-core.project_checks module.
+"""
+
+from civic_lib_core import project_checks
+
+
+def test_check_oversized_py_files_reports_long_files(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "short.py").write_text("a = 1\nb = 2\n")
+    (src_dir / "long.py").write_text("x = 1\n" * 4 + "y = 2")
+    policy = {"max_python_file_length": 4}
+
+    issues = project_checks.check_oversized_py_files(tmp_path, src_dir, policy)
+
+    assert issues == ["Python file too long (5 lines): src/long.py"]
+
+
+def test_count_lines_counts_lf_with_or_without_trailing_newline(tmp_path):
+    path = tmp_path / "mod.py"
+    cases = [("", 0), ("a\n", 1), ("a\nb", 2), ("a\n\nb\n", 3), ("é\n" * 70000, 70000)]
+    for text, expected in cases:
+        path.write_text(text, encoding="utf-8")
+        assert project_checks._count_lines(path) == expected
+
+
+def test_tree_checks_share_one_walk(tmp_path):
+    src_dir = tmp_path / "src"
+    (src_dir / "pkg").mkdir(parents=True)
+    (src_dir / "pkg" / "mod.py").write_text("a = 1\n")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "tool.py").write_text("b = 2\n")
+    (tmp_path / "setup_helper.py").write_text("c = 3\n")
+    (tmp_path / "docs" / "empty").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib" / "site.py").write_text("d = 4\n")
+    (tmp_path / "node_modules" / "pkg" / "empty").mkdir(parents=True)
+
+    assert project_checks.check_empty_dirs(tmp_path) == ["Empty directory found: docs/empty"]
+    assert project_checks.check_py_files_outside_src(tmp_path, src_dir) == [
+        "Python file outside src/ directory: scripts/tool.py"
+    ]
+
+    scan = project_checks._walk_once(tmp_path, src_dir)
+    assert scan.src_py_files == [str(src_dir / "pkg" / "mod.py")]
+    assert scan.outside_py_files == [str(tmp_path / "scripts" / "tool.py")]
+    assert scan.empty_dirs == [str(tmp_path / "docs" / "empty")]
+
+
+def test_required_file_checks_use_top_level_entries(tmp_path):
+    (tmp_path / "README.md").write_text("# Demo\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "dangling.txt").symlink_to(tmp_path / "missing.txt")
+    policy = {
+        "required_files": ["README.md", "LICENSE", "dangling.txt"],
+        "python_project_dirs": ["src", "docs"],
+    }
+    entries = project_checks.scan_top_level(tmp_path)
+
+    for given in (entries, None):
+        assert project_checks.check_required_files(tmp_path, policy, given) == [
+            "Missing required file: LICENSE",
+            "Missing required file: dangling.txt",
+        ]
+        assert project_checks.check_python_project_dirs(tmp_path, policy, given) == [
+            "Missing Python project directory: docs/"
+        ]
+
+
+def test_required_file_checks_recheck_names_missing_from_entries(tmp_path):
+    (tmp_path / "README.md").write_text("# Demo\n")
+    policy = {"required_files": ["README.md"]}
+
+    # A listing that spells the name differently, as on case-insensitive filesystems
+    assert project_checks.check_required_files(tmp_path, policy, {}) == []
+
+
+def test_check_oversized_py_files_counts_many_files_concurrently(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(40):
+        (src_dir / f"mod_{i:02}.py").write_text("x = 1\n" * i)
+    policy = {"max_python_file_length": 37}
+
+    issues = project_checks.check_oversized_py_files(tmp_path, src_dir, policy)
+
+    assert issues == [
+        "Python file too long (38 lines): src/mod_38.py",
+        "Python file too long (39 lines): src/mod_39.py",
+    ]
+
+
+def test_oversized_check_reports_unreadable_and_outside_root_files(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    outside = tmp_path / "elsewhere.py"
+    outside.write_text("x = 1\n" * 3)
+    missing = root / "src" / "gone.py"
+    policy = {"max_python_file_length": 2}
+
+    issues = project_checks._oversized_py_file_issues(root, [str(missing), str(outside)], policy)
+
+    assert issues[0].startswith(f"Could not read file {missing}: ")
+    assert issues[1] == f"Python file too long (3 lines): {outside}"
+
+
+def test_tree_walk_prunes_build_dirs_only_at_project_top(tmp_path):
+    src_dir = tmp_path / "src"
+    (src_dir / "pkg" / "build").mkdir(parents=True)
+    (src_dir / "pkg" / "build" / "gen.py").write_text("x = 1\n" * 3)
+    (tmp_path / "build" / "lib").mkdir(parents=True)
+    (tmp_path / "build" / "lib" / "copy.py").write_text("x = 1\n" * 3)
+    (tmp_path / "src" / "pkg" / "mod.egg-info").mkdir()
+    policy = {"max_python_file_length": 2}
+
+    scan = project_checks._walk_once(tmp_path, src_dir)
+    assert scan.src_py_files == [str(src_dir / "pkg" / "build" / "gen.py")]
+    assert scan.outside_py_files == []
+    assert scan.empty_dirs == []
+    assert project_checks.check_oversized_py_files(tmp_path, src_dir, policy) == [
+        "Python file too long (3 lines): src/pkg/build/gen.py"
+    ]
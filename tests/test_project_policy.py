@@ -0,0 +1,75 @@
+"""
+Test cases for civic-lib-core.project_policy module.
+"""
+
+import os
+
+from civic_lib_core import project_policy
+
+
+def test_override_file_is_merged_and_reparsed_on_change(tmp_path):
+    override = tmp_path / "project_policy.yaml"
+    override.write_text("max_python_file_length: 10\ndocs:\n  docs_dir: site\n")
+
+    policy = project_policy.load_project_policy(override_file=override)
+    assert policy["max_python_file_length"] == 10
+    assert policy["docs"]["docs_dir"] == "site"
+    assert policy["docs"]["docs_api_dir"] == "api"
+    assert policy["__policy_path__"] == str(override)
+
+    # Unchanged files are served from the parse cache
+    misses = project_policy._parse_policy_file.cache_info().misses
+    assert project_policy.load_project_policy(override_file=override) == policy
+    assert project_policy._parse_policy_file.cache_info().misses == misses
+
+    override.write_text("max_python_file_length: 20\n")
+    stat = override.stat()
+    os.utime(override, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    policy = project_policy.load_project_policy(override_file=override)
+    assert project_policy._parse_policy_file.cache_info().misses == misses + 1
+    assert policy["max_python_file_length"] == 20
+    assert policy["docs"]["docs_dir"] == "docs"
+
+
+def test_override_file_rewritten_within_one_mtime_tick_is_reparsed(tmp_path):
+    override = tmp_path / "project_policy.yaml"
+    override.write_text("max_python_file_length: 10\n")
+    stat = override.stat()
+    assert (
+        project_policy.load_project_policy(override_file=override)["max_python_file_length"] == 10
+    )
+
+    # Same mtime, as on a coarse-timestamp filesystem; only the size differs
+    override.write_text("max_python_file_length: 200\n")
+    os.utime(override, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    policy = project_policy.load_project_policy(override_file=override)
+    assert policy["max_python_file_length"] == 200
+
+
+def test_deep_merge_dicts_leaves_inputs_untouched():
+    base = {"a": 1, "nested": {"x": 1, "deep": {"k": "v"}}, "other": {"y": 2}}
+    overrides = {"a": 2, "nested": {"deep": {"k": "w", "n": 3}}, "new": [1]}
+
+    merged = project_policy._deep_merge_dicts(base, overrides)
+
+    assert merged == {
+        "a": 2,
+        "nested": {"x": 1, "deep": {"k": "w", "n": 3}},
+        "other": {"y": 2},
+        "new": [1],
+    }
+    assert base["nested"]["deep"] == {"k": "v"}
+    assert merged["other"] is base["other"]
+
+
+def test_load_project_policy_returns_independent_copies():
+    policy = project_policy.load_project_policy()
+    default_length = policy["max_python_file_length"]
+    policy["max_python_file_length"] = 1
+    policy["docs"]["docs_dir"] = "changed"
+
+    fresh = project_policy.load_project_policy()
+    assert fresh["max_python_file_length"] == default_length
+    assert fresh["docs"]["docs_dir"] != "changed"
@@ -54,3 +54,23 @@ def test_format_report_as_csv_empty() -> None:
     csv_str = report_formatter.format_report_as_csv(empty_report)
 
     assert csv_str.strip() == "No results to export."
+
+
+def test_format_report_as_csv_to_stream(tmp_path) -> None:
+    report = sample_report()
+    path = tmp_path / "report.csv"
+
+    with path.open("w", newline="", encoding="utf-8") as f:
+        assert report_formatter.format_report_as_csv(report, f) is None
+
+    assert path.read_bytes().decode("utf-8") == report_formatter.format_report_as_csv(report)
+
+
+def test_to_markdown_escapes_pipes(tmp_path) -> None:
+    path = tmp_path / "report.md"
+
+    report_formatter.to_markdown([{"id": 1, "name": "A|B"}, {"id": 2, "name": "C"}], path)
+
+    assert path.read_text(encoding="utf-8") == (
+        "| id | name |\n|---|---|\n| 1 | A\\|B |\n| 2 | C |"
+    )
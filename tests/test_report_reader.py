@@ -77,3 +77,13 @@ def validate_report_format(report: dict[str, Any]) -> bool:
         logger.warning(f"Report is missing required fields: {missing}")
         return False
     return True
+
+
+def test_get_latest_report_picks_newest_dated_file(tmp_path: Path) -> None:
+    from civic_lib_core import report_reader
+
+    for name in ["2024-01-01.json", "2024-03-01.json", "notes.json", "2025-01-01.txt"]:
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+
+    assert report_reader.get_latest_report(tmp_path) == tmp_path / "2024-03-01.json"
+    assert report_reader.get_latest_report(tmp_path / "missing") is None
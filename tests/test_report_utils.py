@@ -25,3 +25,9 @@ def test_is_report_file_false_non_date_stem():
 def test_get_agent_name_from_path():
     path = Path("reports/my_test_agent/2024-01-01.json")
     assert report_utils.get_agent_name_from_path(path) == "My Test Agent"
+
+
+def test_is_report_name():
+    assert report_utils.is_report_name("2024-01-01.json")
+    for name in ["2024-01-01.txt", "readme.json", ".json", "2024-01-01", "2024-13-01.json"]:
+        assert not report_utils.is_report_name(name)
@@ -17,6 +17,17 @@ def test_load_json_success(tmp_path: Path) -> None:
     assert result == {"key": "value"}
 
 
+def test_load_json_accepts_everything_json_dumps_writes(tmp_path: Path) -> None:
+    data = {"big": 2**70, "nan": float("nan"), "inf": float("inf")}
+    file = tmp_path / "report.json"
+    file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    result = schema_utils.load_json(file)
+    assert result["big"] == 2**70
+    assert result["nan"] != result["nan"]
+    assert result["inf"] == float("inf")
+
+
 def test_load_json_file_not_found(tmp_path: Path) -> None:
     missing = tmp_path / "missing.json"
     with pytest.raises(FileNotFoundError):
@@ -0,0 +1,34 @@
+"""
+Test cases for civic-lib-core.version_utils module.
+"""
+
+from pathlib import Path
+
+from civic_lib_core import version_utils
+
+
+def test_get_repo_version_sees_version_file_changes(tmp_path: Path, monkeypatch) -> None:
+    version_file = tmp_path / "VERSION"
+    version_file.write_text("1.4.0\n", encoding="utf-8")
+    package = "civic-lib-core-not-installed"
+
+    assert version_utils.get_repo_version(package, tmp_path) == "1.4.0"
+
+    version_file.write_text("1.5.0\n", encoding="utf-8")
+    assert version_utils.get_repo_version(package, tmp_path) == "1.5.0"
+
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "pyproject.toml").write_text('[project]\nversion = "2.0.0"\n', encoding="utf-8")
+    monkeypatch.chdir(other)
+    assert version_utils.get_repo_version(package) == "2.0.0"
+
+
+def test_get_version_from_files_falls_through_missing_files(tmp_path: Path) -> None:
+    assert version_utils.get_version_from_files(tmp_path) is None
+
+    (tmp_path / "package.json").write_text('{"version": "2.0.1"}', encoding="utf-8")
+    assert version_utils.get_version_from_files(tmp_path) == "2.0.1"
+
+    (tmp_path / "pyproject.toml").write_text('[project]\nversion = "3.1.0"\n', encoding="utf-8")
+    assert version_utils.get_version_from_files(tmp_path) == "3.1.0"